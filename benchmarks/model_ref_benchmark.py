@@ -0,0 +1,44 @@
+"""
+Measures the parse, format and hash throughput of model refs.
+
+    python -m benchmarks.model_ref_benchmark
+"""
+import timeit
+
+from sdk.glassbox_config import ModelRef, _parse
+
+REFS = [f"leftshiftone:model-{i % 500}:{i % 3}.{i % 7}.{i % 11}" + ("@onnx" if i % 2 else "") for i in range(10000)]
+
+
+def report(name: str, number: int, seconds: float):
+    print(f"{name:<24} {number / seconds:>14,.0f} ops/s")
+
+
+def main():
+    refs = [ModelRef.from_string(e) for e in REFS]
+    fresh = [ModelRef(e.group, e.name, e.version, e.variant) for e in refs]
+    number = len(REFS)
+
+    def parse_uncached():
+        _parse.cache_clear()
+        for e in REFS:
+            ModelRef.from_string(e)
+
+    benchmarks = {
+        "parse (uncached)": parse_uncached,
+        "parse (cached)": lambda: [ModelRef.from_string(e) for e in REFS],
+        "parse (interned)": lambda: [ModelRef.from_string(e, intern=True) for e in REFS],
+        "format (uncached)": lambda: [ModelRef(e.group, e.name, e.version, e.variant).to_string() for e in refs],
+        "format (cached)": lambda: [e.to_string() for e in refs],
+        "hash (uncached)": lambda: [hash(ModelRef(e.group, e.name, e.version, e.variant)) for e in refs],
+        "hash (cached)": lambda: [hash(e) for e in refs],
+        "dict lookup": lambda: [refs_by_key[e] for e in fresh],
+    }
+    refs_by_key = {e: e for e in refs}
+
+    for name, function in benchmarks.items():
+        report(name, number, min(timeit.repeat(function, number=1, repeat=5)))
+
+
+if __name__ == "__main__":
+    main()
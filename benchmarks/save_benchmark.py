@@ -0,0 +1,68 @@
+"""
+Measures the peak memory and duration of saving a glass box model with very large logs and metric sets.
+
+    python -m benchmarks.save_benchmark
+"""
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sdk.__spi__.enumy import Property
+from sdk.__spi__.types import APACHE_2, Benchmark, Dataset, GitCommit, Metric
+from sdk.__spi__.validation import Logging
+from sdk.glassbox_config import ModelRef
+from sdk.glassbox_model import GlassBoxModel, Purpose
+
+LOG_LINES = 200000
+METRICS = 50000
+
+
+def create_model() -> GlassBoxModel:
+    model = GlassBoxModel(ModelRef("leftshiftone", "benchmark", "1.0.0"))
+    model.checksum = "checksum"
+    model.size = "1000"
+    model.url = "https://leftshiftone/benchmark/1.0.0"
+    model.license = APACHE_2
+    model.description = "benchmark model"
+    model.labels = ["translation"]
+    model.benchmarks = [Benchmark("bleu", "23.5", "https://opus.nlpl.eu")]
+    model.properties = {Property.SEED_VALUE.value: 123, Property.PARAMETER_SIZE.value: 1000000}
+    model.hyper_parameters = {"vocab_size": "58101"}
+    model.metrics = [Metric(f"metric-{i}", str(i / METRICS)) for i in range(METRICS)]
+
+    logs = Logging({"system": "Linux"}, [f"SUCCESS: BenchmarkTest#test_{i}" for i in range(LOG_LINES)])
+    model.data_sources = [(Dataset(url="https://opus.nlpl.eu"), Purpose.TRAIN, logs)]
+    model.code_sources = [(GitCommit("https://github.com/Helsinki-NLP/OPUS-MT-train", "4b0d49d"), Purpose.TRAIN, logs)]
+    return model
+
+
+def save_in_memory(model: GlassBoxModel, name: str, **kwargs):
+    # the former implementation of GlassBoxModel.save
+    with open(name, "w") as outfile:
+        outfile.write(json.dumps(model.as_dict(), indent=4))
+
+
+def measure(name: str, function, model: GlassBoxModel, path: str, **kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(model, path, **kwargs)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<20} peak {peak / 2 ** 20:>8.1f} MiB  {duration:>6.2f} s  {os.path.getsize(path) / 2 ** 20:>8.1f} MiB")
+
+
+def main():
+    model = create_model()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "model.json")
+        measure("in memory", save_in_memory, model, path)
+        measure("streaming", GlassBoxModel.save, model, path)
+        measure("streaming compact", GlassBoxModel.save, model, path, compact=True)
+        measure("streaming gzip", GlassBoxModel.save, model, path + ".gz", compress=True)
+
+
+if __name__ == "__main__":
+    main()
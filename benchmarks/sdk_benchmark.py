@@ -0,0 +1,193 @@
+"""
+Measures the latency and throughput of the sdk against an in-process stub of the glassbox backend
+and compares the throughput with the stored baselines.
+
+    python -m benchmarks.sdk_benchmark                     # fails if a benchmark regressed
+    python -m benchmarks.sdk_benchmark --update-baseline   # stores the current results
+
+Baselines depend on the machine and should be recorded on the machine which runs the check.
+"""
+import argparse
+import base64
+import hmac
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+from sdk.__spi__.enumy import Label, Property
+from sdk.__spi__.transport import TransportPolicy
+from sdk.__spi__.types import APACHE_2, Benchmark, Dataset, GitCommit, Metric
+from sdk.glassbox import GlassBox
+from sdk.glassbox_config import GlassBoxConfig, HMACCredentials, JWTCredentials, ModelRef
+from sdk.glassbox_model import GlassBoxModel, Purpose
+from tests.fake_backend import FakeBackend, FakeHandler
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+API_KEY = "benchmark"
+API_SECRET = "secret"
+
+
+class StubBackend(FakeBackend):
+    """
+    An in-process stub of the model and signin endpoints which verifies the HMAC signatures.
+    """
+
+    def __init__(self):
+        super().__init__(StubHandler)
+        self.models: Dict[str, dict] = {}
+
+
+class StubHandler(FakeHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, which would otherwise stall on delayed acks
+    disable_nagle_algorithm = True
+
+    def do_PUT(self):
+        message = self.read_body()
+        if self.path == "/signin":
+            return self.respond({"idToken": "header.e30.signature"})
+        if not self.verify(message):
+            return self.respond({"errorMessage": "invalid signature"}, 401)
+
+        model = json.loads(message)
+        key = f"{model['group']}:{model['name']}:{model['version']}"
+        with self.server.lock:
+            self.server.models[key] = model
+        self.respond(None)
+
+    def do_POST(self):
+        message = self.read_body()
+        if not self.verify(message):
+            return self.respond({"errorMessage": "invalid signature"}, 401)
+
+        query = {k: v for k, v in json.loads(message).items() if v is not None}
+        with self.server.lock:
+            models = [e for e in self.server.models.values() if all(e.get(k) == v for k, v in query.items())]
+        self.respond([{k: e[k] for k in ["group", "name", "version", "variant"]} for e in models])
+
+    def verify(self, message: bytes) -> bool:
+        expected = hmac.new(API_SECRET.encode(), message, digestmod="sha256").digest()
+        authorization = self.headers.get("Authorization", "")
+        return hmac.compare_digest(authorization, f"HMAC {API_KEY}:{base64.b64encode(expected).decode()}")
+
+
+def create_model(name: str = "opus-mt-it-en", version: str = "1.0.0") -> GlassBoxModel:
+    model = GlassBoxModel(ModelRef("leftshiftone", name, version))
+    model.checksum = "4b0d49ddbbb0ebc7819999288ff3dc6f"
+    model.size = "298000000"
+    model.url = f"https://leftshiftone/{name}/{version}"
+    model.license = APACHE_2
+    model.description = "Tools and resources for open translation services <marian-nmt>"
+    model.add_label(Label.TRANSLATION)
+    model.add_label(Label.ONNX)
+    model.add_property(Property.SEED_VALUE, 123)
+    model.add_property(Property.PARAMETER_SIZE, 1000000)
+    model.add_hyper_parameters({f"parameter_{i}": i / 7 for i in range(100)})
+    model.add_benchmarks([Benchmark("bleu", str(20 + i / 10), f"https://opus.nlpl.eu/test{i}.gz") for i in range(24)])
+    for i in range(50):
+        model.add_metric(Metric(f"metric_{i}", str(i / 50)))
+    model.add_code(GitCommit("https://github.com/Helsinki-NLP/OPUS-MT-train", "4b0d49d"), [Purpose.TRAIN, Purpose.TEST])
+    model.add_data(Dataset(url="https://opus.nlpl.eu"), Purpose.TRAIN)
+    model.add_data(Dataset(url="https://object.pouta.csc.fi/OPUS-MT-models/en-de/test.txt"), Purpose.TEST)
+    return model
+
+
+def measure(function: Callable[[], any], min_time: float) -> dict:
+    for _ in range(3):
+        function()
+
+    latencies = []
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        call = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - call)
+
+    latencies.sort()
+    return {
+        "ops": len(latencies) / sum(latencies),
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p95_us": latencies[int(len(latencies) * 0.95)] * 1e6,
+    }
+
+
+def run(min_time: float = 0.5) -> Dict[str, dict]:
+    """
+    Runs all benchmarks and returns their throughput (ops) and latencies.
+    """
+    model = create_model()
+    results = {}
+    with StubBackend() as backend, tempfile.TemporaryDirectory() as directory:
+        policy = TransportPolicy(rate=1e9, burst=10 ** 6)
+        glassbox = GlassBox(GlassBoxConfig(backend.url, HMACCredentials(API_KEY, API_SECRET), policy))
+        payload = model.as_dict()
+        message = glassbox.to_json(payload)
+
+        path = os.path.join(directory, "model.json")
+        model.save(path)
+
+        credentials = JWTCredentials("benchmark", "password")
+
+        benchmarks = {
+            "validate": model.validate,
+            "as_dict": model.as_dict,
+            "to_json": lambda: glassbox.to_json(payload),
+            "sign": lambda: glassbox._get_token(message),
+            "sign_in": lambda: glassbox._sign_in(credentials),
+            "create_model": lambda: glassbox.create_model(model),
+            "search_model": lambda: glassbox.search_model(name="opus-mt-it-en", version="1.0.0"),
+            "from_json": lambda: GlassBoxModel.from_json(path),
+            "checksum": lambda: glassbox.checksum(payload),
+        }
+        for name, function in benchmarks.items():
+            results[name] = measure(function, min_time)
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> bool:
+    """
+    Prints the results and returns False if the throughput of a benchmark dropped below
+    the baseline by more than the given threshold.
+    """
+    passed = True
+    print(f"{'benchmark':<14} {'ops/s':>12} {'p50 us':>10} {'p95 us':>10} {'baseline':>12} {'change':>8}")
+    for name, result in results.items():
+        line = f"{name:<14} {result['ops']:>12,.0f} {result['p50_us']:>10.1f} {result['p95_us']:>10.1f}"
+        if name in baseline:
+            change = result["ops"] / baseline[name]["ops"] - 1
+            line += f" {baseline[name]['ops']:>12,.0f} {change:>+8.1%}"
+            if change < -threshold:
+                line += "  REGRESSION"
+                passed = False
+        print(line)
+    return passed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="sdk_benchmark")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25, help="the allowed relative throughput drop")
+    parser.add_argument("--min-time", type=float, default=0.5, help="the minimal duration per benchmark in seconds")
+    args = parser.parse_args(argv)
+
+    results = run(args.min_time)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+
+    passed = compare(results, baseline, args.threshold)
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=4)
+        return 0
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
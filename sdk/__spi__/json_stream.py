@@ -0,0 +1,88 @@
+import codecs
+import json
+from typing import Iterable, Iterator
+
+WHITESPACE = " \t\r\n"
+DELIMITERS = WHITESPACE + ",]"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """
+    Incrementally parses a json array from the given utf-8 chunks and yields its elements
+    as soon as they are complete. A body which is not an array is parsed at once and an
+    error object is raised as ValueError.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer, position, ended = "", 0, False
+    # the number of unparsed characters which have to be buffered before parsing again
+    required = 1
+    state = "start"
+
+    while True:
+        while position < len(buffer) and buffer[position] in WHITESPACE:
+            position += 1
+
+        if position < len(buffer):
+            char = buffer[position]
+            if state == "start":
+                if char != "[":
+                    yield from _parse_body(buffer[position:] + "".join(text.decode(e) for e in chunks)
+                                           + text.decode(b"", final=True))
+                    return
+                state, position = "first", position + 1
+                continue
+            if state == "end":
+                raise ValueError(f"unexpected character {char!r} after json array")
+            if char == "]" and state in ("first", "separator"):
+                state, position = "end", position + 1
+                continue
+            if state == "separator":
+                if char != ",":
+                    raise ValueError(f"unexpected character {char!r} in json array")
+                state, position = "value", position + 1
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if ended:
+                    raise
+                end = None
+            # a number is only complete once a delimiter follows, e.g. 1 may continue as 1.5
+            if end is not None and (ended or end < len(buffer) and buffer[end] in DELIMITERS):
+                yield value
+                state, position = "separator", end
+                continue
+            # incomplete elements are parsed again once the buffer has doubled which keeps
+            # the parsing time of large elements linear
+            required = 2 * (len(buffer) - position)
+
+        if ended:
+            if state in ("start", "end"):
+                return
+            raise ValueError("truncated json array")
+
+        # chunks are joined at once in order to not copy the unparsed buffer for each of them
+        parts = [buffer[position:]]
+        size = len(parts[0])
+        required = max(required, size + 1)
+        while size < required:
+            chunk = next(chunks, None)
+            if chunk is None:
+                parts.append(text.decode(b"", final=True))
+                ended = True
+                break
+            parts.append(text.decode(chunk))
+            size += len(parts[-1])
+        buffer, position, required = "".join(parts), 0, 1
+
+
+def _parse_body(body: str) -> Iterator:
+    body = json.loads(body)
+    if isinstance(body, dict) and "errorMessage" in body:
+        raise ValueError(body["errorMessage"])
+    if body is not None:
+        if not isinstance(body, list):
+            raise ValueError("expected a json array")
+        yield from body
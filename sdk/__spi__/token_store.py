@@ -0,0 +1,133 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+Token = Tuple[str, float]
+
+# tokens expiring within the given number of seconds are treated as expired
+EXPIRY_MARGIN = 60.0
+DEFAULT_TTL = 3000.0
+
+
+def token_key(url: str, username: str) -> str:
+    return hashlib.sha256(f"{url}\0{username}".encode()).hexdigest()
+
+
+def token_expiry(token: str) -> float:
+    """
+    Returns the expiry timestamp of the given jwt. The token signature is not verified.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + DEFAULT_TTL
+
+
+def is_valid(token: Optional[Token]) -> bool:
+    return token is not None and token[1] - EXPIRY_MARGIN > time.time()
+
+
+class TokenStore(ABC):
+    """
+    A token store shares sign in tokens between glassbox instances.
+    """
+
+    @contextmanager
+    def lock(self):
+        yield
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Token]:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, token: Token):
+        pass
+
+
+class FileTokenStore(TokenStore):
+    """
+    Stores tokens in a json file which is shared between processes. Sign ins are serialized
+    with an exclusive file lock so that a pool of workers signs in only once.
+    By default the file is stored in a private per-user cache directory. On POSIX systems
+    the store refuses to use files or directories which other users own or can access.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            directory = os.path.join(cache, "glassbox")
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            _check_private(directory)
+            path = os.path.join(directory, "tokens.json")
+        self.path = path
+
+    @contextmanager
+    def lock(self):
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            _check_private(self.path + ".lock", fd)
+            _lock_file(fd, True)
+            try:
+                yield
+            finally:
+                _lock_file(fd, False)
+        finally:
+            os.close(fd)
+
+    def get(self, key: str) -> Optional[Token]:
+        token = self._read().get(key)
+        return (token[0], token[1]) if token is not None else None
+
+    def put(self, key: str, token: Token):
+        tokens = {k: v for k, v in self._read().items() if is_valid(v)}
+        tokens[key] = list(token)
+
+        # the file is replaced atomically so that readers never see partial content
+        fd, temp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+        with os.fdopen(fd, "w") as file:
+            json.dump(tokens, file)
+        os.replace(temp, self.path)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r") as file:
+                _check_private(self.path, file.fileno())
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+
+def _check_private(path: str, fd: Optional[int] = None):
+    # windows has neither uids nor posix permissions, the user profile is protected by acls
+    if not hasattr(os, "getuid"):
+        return
+    stat = os.fstat(fd) if fd is not None else os.stat(path)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        raise PermissionError(f"{path} must be owned and only be accessible by the current user")
+
+
+def _lock_file(fd: int, locked: bool):
+    try:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_EX if locked else fcntl.LOCK_UN)
+    except ImportError:
+        import msvcrt
+        if not locked:
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            return
+        while True:
+            try:
+                # LK_LOCK gives up after 10 attempts
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass
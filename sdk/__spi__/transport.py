@@ -0,0 +1,223 @@
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised if a request is rejected because the circuit breaker is open.
+    """
+
+
+@dataclass
+class TransportPolicy:
+    """
+    The transport policy controls how requests are sent to the glassbox backend.
+    """
+
+    # token bucket rate limiting (requests per second and burst size)
+    rate: float = 10.0
+    burst: int = 10
+
+    # adaptive concurrency (AIMD) boundaries
+    min_concurrency: int = 1
+    max_concurrency: int = 8
+
+    # exponential backoff with full jitter
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+    # circuit breaker
+    breaker_threshold: int = 5
+    breaker_reset: float = 30.0
+
+    timeout: Optional[float] = 30.0
+
+
+class TokenBucket:
+    """
+    A token bucket refilled with the given rate which allows bursts up to its capacity.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """
+    Limits the number of requests in flight. The limit grows additively with every
+    successful request and is halved whenever the backend throttles.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, *args):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self):
+        with self._cond:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def on_throttle(self):
+        with self._cond:
+            self.limit = max(self.min_limit, self.limit / 2)
+
+
+class CircuitBreaker:
+    """
+    Opens after the given number of consecutive failures and lets a single trial
+    request through once the reset timeout has elapsed.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold: int, reset: float):
+        self.threshold = threshold
+        self.reset = reset
+        self.state = CircuitBreaker.CLOSED
+        self._failures = 0
+        self._opened = 0.0
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        with self._lock:
+            if self.state == CircuitBreaker.OPEN:
+                if time.monotonic() - self._opened < self.reset:
+                    raise CircuitOpenError("circuit breaker is open")
+                self.state = CircuitBreaker.HALF_OPEN
+            elif self.state == CircuitBreaker.HALF_OPEN:
+                raise CircuitOpenError("circuit breaker is half-open")
+
+    def on_success(self):
+        with self._lock:
+            self.state = CircuitBreaker.CLOSED
+            self._failures = 0
+
+    def on_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == CircuitBreaker.HALF_OPEN or self._failures >= self.threshold:
+                self.state = CircuitBreaker.OPEN
+                self._opened = time.monotonic()
+
+
+def retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the given Retry-After header value (delay seconds or http date).
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class Transport:
+    """
+    Sends requests according to the given transport policy.
+    """
+
+    def __init__(self, policy: TransportPolicy):
+        import requests
+
+        self.policy = policy
+        self.pid = os.getpid()
+        self.session = requests.Session()
+        self.bucket = TokenBucket(policy.rate, policy.burst)
+        self.limiter = AdaptiveLimiter(policy.min_concurrency, policy.max_concurrency)
+        self.breaker = CircuitBreaker(policy.breaker_threshold, policy.breaker_reset)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.policy.backoff_max, self.policy.backoff_base * 2 ** attempt))
+
+    def request(self, method: str, url: str, data: str, headers: dict, idempotent: bool, stream: bool = False):
+        """
+        Sends the request and retries throttled responses as well as server errors
+        and connection failures of idempotent requests. The body of streamed responses
+        is read on demand and the caller has to close them.
+        """
+        import requests
+
+        attempt = 0
+        while True:
+            self.breaker.before_request()
+            self.bucket.acquire()
+            try:
+                with self.limiter:
+                    response = self.session.request(method, url, data=data, headers=headers,
+                                                    timeout=self.policy.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout):
+                self.breaker.on_failure()
+                if not idempotent or attempt >= self.policy.max_retries:
+                    raise
+                time.sleep(self.backoff(attempt))
+                attempt += 1
+                continue
+            except Exception:
+                self.breaker.on_failure()
+                raise
+
+            if response.status_code == 429:
+                # throttled requests were not processed and can always be retried
+                self.limiter.on_throttle()
+                self.breaker.on_success()
+                delay = retry_after(response.headers.get("Retry-After"))
+            elif response.status_code >= 500:
+                self.breaker.on_failure()
+                if not idempotent:
+                    return response
+                delay = retry_after(response.headers.get("Retry-After"))
+            else:
+                self.limiter.on_success()
+                self.breaker.on_success()
+                return response
+
+            if attempt >= self.policy.max_retries:
+                return response
+            # releases the connection of a streamed response before retrying
+            response.close()
+            time.sleep(min(delay, self.policy.backoff_max) if delay is not None else self.backoff(attempt))
+            attempt += 1
@@ -8,6 +8,7 @@ class Traceable(ABC):
     """
     Traceable classes can be validated if the given url information is available.
     If the given url is not available the user is informed about it.
+    See sdk.glassbox_verifier.UrlVerifier.
     """
 
     url: str
@@ -0,0 +1,193 @@
+"""
+The glassbox command line interface.
+
+    glassbox push <directory|file.jsonl> [--workers 8] [--state push.state] [--dry-run]
+    glassbox search [--group G] [--name N] [--version V] [--variant V]
+    glassbox verify <directory|file.jsonl>
+
+The backend url is read from GLASSBOX_URL and the credentials from API_KEY/API_SECRET
+(HMAC) or API_USERNAME/API_PASSWORD (JWT). The sdk modules are imported lazily in order
+to keep the startup time low.
+"""
+import argparse
+import os
+import sys
+import time
+from functools import partial
+from typing import Callable, Iterator, Optional, Tuple
+
+Manifest = Tuple[str, Callable[[], dict]]
+
+
+def create_glassbox(url: Optional[str]):
+    from sdk.__spi__ import BETA_API_URL
+    from sdk.__spi__.token_store import FileTokenStore
+    from sdk.glassbox import GlassBox
+    from sdk.glassbox_config import GlassBoxConfig, HMACCredentials, JWTCredentials
+
+    token_store = None
+    if "API_KEY" in os.environ:
+        credentials = HMACCredentials(os.environ["API_KEY"], os.environ["API_SECRET"])
+    elif "API_USERNAME" in os.environ:
+        credentials = JWTCredentials(os.environ["API_USERNAME"], os.environ["API_PASSWORD"])
+        # only sign ins need the token cache, HMAC requests must also work with a read-only home
+        token_store = FileTokenStore()
+    else:
+        raise SystemExit("missing credentials: set API_KEY/API_SECRET or API_USERNAME/API_PASSWORD")
+
+    url = url or os.environ.get("GLASSBOX_URL", BETA_API_URL)
+    return GlassBox(GlassBoxConfig(url, credentials, token_store=token_store))
+
+
+def read_manifests(source: str) -> Iterator[Manifest]:
+    """
+    Lazily yields the id and a loader of the manifests in the given directory or jsonl file.
+    The manifests are only parsed when their loader is called.
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(".json") or name.endswith(".json.gz"):
+                path = os.path.join(source, name)
+                yield path, partial(_load_file, path)
+    else:
+        with open(source, "r") as file:
+            for number, line in enumerate(file, 1):
+                if len(line.strip()) > 0:
+                    yield f"{source}:{number}", partial(_load_line, line)
+
+
+def _load_file(path: str) -> dict:
+    from sdk.glassbox_model import read_json
+    return read_json(path)
+
+
+def _load_line(line: str) -> dict:
+    import json
+    return json.loads(line)
+
+
+def push(args) -> int:
+    import json
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    from sdk.glassbox_model import GlassBoxModel
+
+    done = set()
+    if args.state is not None and os.path.exists(args.state):
+        with open(args.state, "r") as file:
+            done = {line.rstrip("\n") for line in file}
+
+    glassbox = None if args.dry_run else create_glassbox(args.url)
+    state = open(args.state, "a") if args.state is not None and not args.dry_run else None
+
+    def upload(manifest: Manifest) -> int:
+        model = GlassBoxModel.from_dict(manifest[1]())
+        if glassbox is None:
+            # serializes and validates the model like create_model without sending it
+            return len(json.dumps(model.as_dict(), separators=(",", ":")))
+        glassbox.create_model(model)
+        return 0
+
+    skipped, succeeded, failed, size = 0, 0, 0, 0
+
+    def collect(futures: dict, completed: set):
+        nonlocal succeeded, failed, size
+        for future in completed:
+            manifest_id = futures.pop(future)
+            try:
+                size += future.result()
+                succeeded += 1
+                if state is not None:
+                    state.write(manifest_id + "\n")
+                    state.flush()
+            except Exception as e:
+                # unreadable manifests are counted like failed uploads
+                failed += 1
+                print(f"\n{manifest_id}: {type(e).__name__}: {e}", file=sys.stderr)
+            print(f"\r[{succeeded + failed}] {succeeded} succeeded, {failed} failed",
+                  end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {}
+            for manifest in read_manifests(args.source):
+                if manifest[0] in done:
+                    skipped += 1
+                    continue
+                # bounds the number of manifests held in memory
+                if len(futures) >= 4 * args.workers:
+                    collect(futures, wait(futures, return_when=FIRST_COMPLETED).done)
+                futures[executor.submit(upload, manifest)] = manifest[0]
+            collect(futures, wait(futures).done)
+    finally:
+        if state is not None:
+            state.close()
+
+    duration = time.perf_counter() - start
+    print(f"\n{skipped} skipped, {succeeded} succeeded, {failed} failed in {duration:.2f}s", file=sys.stderr)
+    if args.dry_run and duration > 0:
+        print(f"{succeeded / duration:.1f} manifests/s, {size / duration / 2 ** 20:.2f} MiB/s", file=sys.stderr)
+    return 1 if failed > 0 else 0
+
+
+def search(args) -> int:
+    import json
+
+    glassbox = create_glassbox(args.url)
+    for model in glassbox.iter_models(args.group, args.name, args.version, args.variant):
+        sys.stdout.write(json.dumps(model) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def verify(args) -> int:
+    from sdk.glassbox_model import GlassBoxModel
+    from sdk.glassbox_verifier import UrlVerifier
+
+    failed = 0
+    models = []
+    for manifest_id, load in read_manifests(args.source):
+        try:
+            models.append(GlassBoxModel.from_dict(load()))
+        except Exception as e:
+            failed += 1
+            print(f"{manifest_id}: {type(e).__name__}: {e}", file=sys.stderr)
+
+    with UrlVerifier(parallelism=args.workers, timeout=args.timeout) as verifier:
+        result = verifier.verify_all(models)
+
+    for verification in result.values():
+        status = "ok" if verification.reachable else "unreachable"
+        print(f"{status}\t{verification.status or verification.error}\t{verification.url}")
+    return 0 if failed == 0 and all(e.reachable for e in result.values()) else 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="glassbox")
+    parser.add_argument("--url", help="the glassbox backend url")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    push_parser = commands.add_parser("push", help="uploads the model manifests")
+    push_parser.add_argument("source", help="a directory of json manifests or a jsonl file")
+    push_parser.add_argument("--workers", type=int, default=8)
+    push_parser.add_argument("--state", help="a file which records uploaded manifests in order to resume")
+    push_parser.add_argument("--dry-run", action="store_true", help="only parses and validates the manifests")
+    push_parser.set_defaults(function=push)
+
+    search_parser = commands.add_parser("search", help="searches models and writes them as json lines")
+    for name in ["group", "name", "version", "variant"]:
+        search_parser.add_argument(f"--{name}")
+    search_parser.set_defaults(function=search)
+
+    verify_parser = commands.add_parser("verify", help="verifies the urls of the model manifests")
+    verify_parser.add_argument("source", help="a directory of json manifests or a jsonl file")
+    verify_parser.add_argument("--workers", type=int, default=16)
+    verify_parser.add_argument("--timeout", type=float, default=10.0)
+    verify_parser.set_defaults(function=verify)
+
+    args = parser.parse_args(argv)
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterator, Optional
 
 from sdk.glassbox_config import GlassBoxConfig
 from sdk.glassbox_model import GlassBoxModel, ModelRef
@@ -24,7 +24,22 @@ class GlassBox(HttpMixin, DataMixin):
             "name": name,
             "version": version,
             "variant": variant
-        })
+        }, idempotent=True)
+
+    def iter_models(self,
+                    group: Optional[str] = None,
+                    name: Optional[str] = None,
+                    version: Optional[str] = None,
+                    variant: Optional[str] = None) -> Iterator[dict]:
+        """
+        Searches models like search_model but yields them while the response is received.
+        """
+        return self.http_post_stream("model", {
+            "group": group,
+            "name": name,
+            "version": version,
+            "variant": variant
+        }, idempotent=True)
 
     # def rate_model(self, model_ref: ModelRef):
     #     return self.http_post({"__type__": "model/rate", "modelRef": model_ref.to_string()})
@@ -0,0 +1,240 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from sdk.glassbox_config import ModelRef
+
+Version = Tuple[int, int, int]
+
+# matches every variant including the base model (variant None)
+ANY_VARIANT = "*"
+
+_MAX = (2 ** 31, 0, 0)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS model (
+    id INTEGER PRIMARY KEY,
+    ref TEXT NOT NULL UNIQUE,
+    "group" TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    major INTEGER NOT NULL,
+    minor INTEGER NOT NULL,
+    patch INTEGER NOT NULL,
+    variant TEXT,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS model_version ON model ("group", name, major, minor, patch);
+CREATE INDEX IF NOT EXISTS model_name ON model (name);
+CREATE TABLE IF NOT EXISTS model_label (
+    model_id INTEGER NOT NULL REFERENCES model (id) ON DELETE CASCADE,
+    label TEXT NOT NULL,
+    PRIMARY KEY (label, model_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def parse_version(version: str) -> Version:
+    """
+    Parses the given semantic version string (major.minor.patch).
+    """
+    match = re.fullmatch(r"([0-9]+)\.([0-9]+)\.([0-9]+)", version)
+    if match is None:
+        raise ValueError(f"invalid version {version}")
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def parse_range(spec: str) -> List[Tuple[Version, Version]]:
+    """
+    Parses the given semantic version range into a list of half-open version intervals.
+    Supported are exact versions, wildcards (*, 1.x, 1.2.x), caret (^1.2.0), tilde (~1.2.0),
+    comparator sets (>=1.0.0 <2.0.0) and alternatives separated by ||.
+    """
+    return [_parse_comparators(e.strip()) for e in spec.split("||")]
+
+
+def _parse_comparators(spec: str) -> Tuple[Version, Version]:
+    low, high = (0, 0, 0), _MAX
+    for comparator in spec.split() or ["*"]:
+        match = re.fullmatch(r"(\^|~|>=|<=|>|<|=)?([0-9]+|[xX*])(?:\.([0-9]+|[xX*]))?(?:\.([0-9]+|[xX*]))?",
+                             comparator)
+        if match is None:
+            raise ValueError(f"invalid version range {spec}")
+        op = match.group(1) or "="
+        parts = [int(e) for e in match.groups()[1:] if e is not None and e not in "xX*"]
+        version = tuple(parts + [0] * (3 - len(parts)))
+        # a partial version acts as wildcard for the missing parts
+        following = _bump(version, len(parts)) if len(parts) < 3 else _next(version)
+
+        if len(parts) == 0 or op == "=":
+            lower, upper = version, following
+        elif op == "^":
+            index = next((i for i, e in enumerate(parts) if e != 0), len(parts) - 1)
+            lower, upper = version, _bump(version, index + 1)
+        elif op == "~":
+            lower, upper = version, _bump(version, min(len(parts), 2))
+        elif op == ">=":
+            lower, upper = version, _MAX
+        elif op == ">":
+            lower, upper = following, _MAX
+        elif op == "<":
+            lower, upper = (0, 0, 0), version
+        else:
+            lower, upper = (0, 0, 0), following
+        low, high = max(low, lower), min(high, upper)
+    return low, high
+
+
+def _bump(version: Version, length: int) -> Version:
+    if length == 0:
+        return _MAX
+    prefix = list(version[:length])
+    prefix[-1] += 1
+    return tuple(prefix + [0] * (3 - length))
+
+
+def _next(version: Version) -> Version:
+    return version[0], version[1], version[2] + 1
+
+
+class GlassBoxCatalog:
+    """
+    The catalog is a local, indexed mirror of the glassbox model registry which answers
+    version range, label and prefix queries without a network roundtrip.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self):
+        self.connection.close()
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """
+        Returns the cursor of the last synchronization.
+        """
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'cursor'").fetchone()
+        return row[0] if row is not None else None
+
+    def sync(self, glassbox) -> int:
+        """
+        Synchronizes the catalog with the backend of the given glassbox instance and
+        returns the number of changed models. The backend listing is compared against
+        the stored digests so that only added, changed or removed models are written.
+        """
+        models = glassbox.search_model() or []
+        digest = hashlib.sha256(json.dumps(models, sort_keys=True).encode()).hexdigest()
+        if digest == self.cursor:
+            return 0
+        return self.update(models, digest)
+
+    def update(self, models: List[dict], cursor: Optional[str] = None) -> int:
+        """
+        Replaces the catalog content with the given models and returns the number of changed models.
+        """
+        with self.lock, self.connection:
+            known = dict(self.connection.execute("SELECT ref, digest FROM model"))
+            changed = 0
+            for model in models:
+                ref = ModelRef(model["group"], model["name"], model["version"], model.get("variant"))
+                key = ref.to_string()
+                data = json.dumps(model, sort_keys=True)
+                digest = hashlib.sha256(data.encode()).hexdigest()
+                if known.pop(key, None) == digest:
+                    continue
+                self._upsert(ref, key, digest, data, model.get("labels") or [])
+                changed += 1
+
+            for key in known:
+                self.connection.execute("DELETE FROM model WHERE ref = ?", (key,))
+            changed += len(known)
+
+            self.connection.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                        [("cursor", cursor or ""), ("synced", str(time.time()))])
+        return changed
+
+    def _upsert(self, ref: ModelRef, key: str, digest: str, data: str, labels: List[str]):
+        major, minor, patch = parse_version(ref.version)
+        self.connection.execute("DELETE FROM model WHERE ref = ?", (key,))
+        model_id = self.connection.execute(
+            'INSERT INTO model (ref, "group", name, version, major, minor, patch, variant, digest, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, ref.group, ref.name, ref.version, major, minor, patch, ref.variant, digest, data)
+        ).lastrowid
+        self.connection.executemany("INSERT OR IGNORE INTO model_label (model_id, label) VALUES (?, ?)",
+                                    [(model_id, label) for label in labels])
+
+    def find(self,
+             group: Optional[str] = None,
+             name: Optional[str] = None,
+             version: Optional[str] = None,
+             variant: Optional[str] = ANY_VARIANT,
+             labels: Optional[List[str]] = None,
+             prefix: Optional[str] = None,
+             limit: Optional[int] = None) -> List[ModelRef]:
+        """
+        Returns the matching model refs ordered by descending version. The version may be
+        any range supported by parse_range and the prefix is matched against the model name.
+        A variant of None only matches base models while ANY_VARIANT matches every variant.
+        """
+        clauses, params = [], []
+        if group is not None:
+            clauses.append('"group" = ?')
+            params.append(group)
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        if variant is None:
+            clauses.append("variant IS NULL")
+        elif variant != ANY_VARIANT:
+            clauses.append("variant = ?")
+            params.append(variant)
+        if prefix is not None:
+            clauses.append("name >= ? AND name < ?")
+            params.extend([prefix, prefix + "\U0010ffff"])
+        if version is not None:
+            ranges = []
+            for low, high in parse_range(version):
+                ranges.append("((major, minor, patch) >= (?, ?, ?) AND (major, minor, patch) < (?, ?, ?))")
+                params.extend(low + high)
+            clauses.append("(" + " OR ".join(ranges) + ")")
+        for label in labels or []:
+            clauses.append("id IN (SELECT model_id FROM model_label WHERE label = ?)")
+            params.append(label)
+
+        query = 'SELECT "group", name, version, variant FROM model'
+        if len(clauses) > 0:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY major DESC, minor DESC, patch DESC, ref"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return [ModelRef(*row) for row in self.connection.execute(query, params)]
+
+    def resolve(self, group: str, name: str, version: str = "*", variant: Optional[str] = None) -> Optional[ModelRef]:
+        """
+        Returns the latest model ref matching the given version range. Like in ModelRef a variant
+        of None denotes the base model, ANY_VARIANT resolves the latest of all variants.
+        """
+        result = self.find(group=group, name=name, version=version, variant=variant, limit=1)
+        return result[0] if len(result) > 0 else None
+
+    def get(self, model_ref: ModelRef) -> Optional[dict]:
+        """
+        Returns the stored backend representation of the given model ref.
+        """
+        row = self.connection.execute("SELECT data FROM model WHERE ref = ?", (model_ref.to_string(),)).fetchone()
+        return json.loads(row[0]) if row is not None else None
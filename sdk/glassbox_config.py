@@ -1,7 +1,11 @@
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
+from sdk.__spi__.token_store import TokenStore
+from sdk.__spi__.transport import TransportPolicy
+
 class Credentials:
     pass
 
@@ -23,31 +27,62 @@ class GlassBoxConfig:
 
     url: str
     credentials: Credentials
+    policy: TransportPolicy = field(default_factory=TransportPolicy)
+    token_store: Optional[TokenStore] = None
 
-@dataclass
+_MODEL_REF = re.compile(r"([a-zA-Z0-9_-]+):([a-zA-Z0-9_-]+):([0-9]+\.[0-9]+\.[0-9]+)(?:@([a-zA-Z0-9_-]+))?")
+
+
+@dataclass(frozen=True, slots=True)
 class ModelRef:
     """
     A model ref object is used to uniquely identify an AI model.
+    Model refs are immutable and can therefore be used as dictionary keys.
     """
     group: str
     name: str
     version: str
     variant: Optional[str] = None
 
+    _string: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    @staticmethod
+    def from_string(model_ref: str, intern: bool = False) -> 'ModelRef':
+        """
+        Parses the given model ref string (group:name:version[@variant]). Parse results are cached
+        per string, so repeated strings already yield the same instance while they are cached.
+        Interning additionally shares the instance with equal refs created in other ways (see intern).
+        """
+        parsed = _parse(model_ref)
+        return ModelRef.intern(parsed) if intern else parsed
+
     @staticmethod
-    def from_string(model_ref: str) -> 'ModelRef':
-        parsed = re.search(r"([a-zA-Z0-9_-]+)\:([a-zA-Z0-9_-]+)\:([0-9]+\.[0-9]+\.[0-9]+)(@[a-zA-Z0-9_-]+)?", model_ref)
+    def intern(model_ref: 'ModelRef') -> 'ModelRef':
+        """
+        Returns the canonical instance of the given model ref. Unlike the parse cache, which is keyed
+        by string, this deduplicates equal refs regardless of how they were created (constructor,
+        from_dict or from_string). The table is bounded and evicts the least recently used refs.
+        """
+        return _intern(model_ref)
 
-        group = parsed.group(1)
-        name = parsed.group(2)
-        version = parsed.group(3)
-        variant = parsed.group(4)[1:] if parsed.group(4) is not None else None
-        return ModelRef(group, name, version, variant)
+    def to_string(self) -> str:
+        if self._string is None:
+            if self.variant is not None:
+                string = f"{self.group}:{self.name}:{self.version}@{self.variant}"
+            else:
+                string = f"{self.group}:{self.name}:{self.version}"
+            object.__setattr__(self, "_string", string)
+        return self._string
 
-    def to_string(self):
-        if self.variant is not None:
-            return f"{self.group}:{self.name}:{self.version}@{self.variant}"
-        return f"{self.group}:{self.name}:{self.version}"
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((self.group, self.name, self.version, self.variant)))
+        return self._hash
+
+    def __reduce__(self):
+        # the cached hash must not be transferred between processes
+        return ModelRef, (self.group, self.name, self.version, self.variant)
 
     def as_dict(self):
         return {
@@ -59,4 +94,21 @@ class ModelRef:
 
     @staticmethod
     def from_dict(data: dict):
-        return ModelRef(data["group"], data["name"], data["version"],data["variant"])
\ No newline at end of file
+        return ModelRef(data["group"], data["name"], data["version"], data["variant"])
+
+
+@lru_cache(maxsize=65536)
+def _intern(model_ref: ModelRef) -> ModelRef:
+    return model_ref
+
+
+@lru_cache(maxsize=65536)
+def _parse(model_ref: str) -> ModelRef:
+    parsed = _MODEL_REF.fullmatch(model_ref)
+    if parsed is None:
+        raise ValueError(f"invalid model ref {model_ref}")
+
+    group, name, version, variant = parsed.groups()
+    model_ref = ModelRef(group, name, version, variant)
+    object.__setattr__(model_ref, "_string", parsed.group(0))
+    return model_ref
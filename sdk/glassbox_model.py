@@ -1,7 +1,7 @@
 import json
 import logging
 from enum import Enum
-from typing import List, Union, Optional, Tuple, OrderedDict
+from typing import Iterator, List, Union, Optional, Tuple, OrderedDict, TextIO
 
 from sdk.__spi__.enumy import Property, Label
 from sdk.__spi__.types import License, Benchmark, Metric, DataSource, CodeSource
@@ -47,17 +47,30 @@ class GlassBoxModel(DataMixin):
         self.version = model_ref.version
         self.variant = model_ref.variant
 
+        # the collections must not be shared between instances
+        self.labels = []
+        self.benchmarks = []
+        self.properties = {}
+        self.hyper_parameters = {}
+        self.metrics = []
+        self.data_sources = []
+        self.code_sources = []
+
     @staticmethod
     def from_json(path: str):
-        with open(path, "r") as file:
-            obj = json.load(file)
+        return GlassBoxModel.from_dict(read_json(path))
+
+    @staticmethod
+    def from_dict(obj: dict):
         model_ref = ModelRef.from_dict(obj)
         model = GlassBoxModel(model_ref)
-        model.license = License.from_dict(obj)
+        model.license = License.from_dict(obj["license"])
         model.checksum = obj["checksum"]
         model.size = obj["size"]
         model.url = obj["url"]
-        model.description = obj["description"]
+        if obj.get("description") is not None:
+            from html import unescape
+            model.description = unescape(obj["description"])
         model.labels = obj["labels"]
         model.benchmarks = [Benchmark.from_dict(e) for e in obj["benchmarks"]]
         model.properties = obj["properties"]
@@ -174,47 +187,152 @@ class GlassBoxModel(DataMixin):
         """
         Returns the glass box model as a dictionary
         """
+        return {k: list(v) if isinstance(v, Iterator) else v for k, v in self._items()}
+
+    def _items(self) -> Iterator[Tuple[str, any]]:
+        """
+        Yields the key value pairs of the glass box model. Lists which must be converted
+        are yielded lazily as iterators in order to avoid intermediate copies.
+        """
         self.validate()
 
-        def tuple_to_dict(data: Tuple[any, Purposes, Optional[Logging]]):
-            purposes = data[1] if isinstance(data[1], list) else [data[1]]
-            purposes = list(map(lambda x: x.name.lower(), purposes))
-
-            _obj = {"purposes": purposes}
-            for k, v in data[0].__dict__.items():
-                if v is not None:
-                    _obj[k] = v
-            if data[2] is not None:
-                _obj["logging"] = data[2].as_dict()
-            return _obj
-
-        obj = {
-            "group": self.group,
-            "name": self.name,
-            "version": self.version,
-            "variant": self.variant,
-            "license": self.license.__dict__,
-            "checksum": self.checksum,
-            "size": self.size,
-            "url": self.url,
-            "labels": self.labels,
-            "benchmarks": list(map(lambda x: x.__dict__, self.benchmarks)),
-            "properties": self.properties,
-            "hyperParameters": self.hyper_parameters,
-            "metrics": [e.__dict__ for e in self.metrics],
-            "dataSources": list(map(lambda x: tuple_to_dict(x), self.data_sources)),
-            "codeSources": list(map(lambda x: tuple_to_dict(x), self.code_sources)),
-        }
+        yield "group", self.group
+        yield "name", self.name
+        yield "version", self.version
+        yield "variant", self.variant
+        yield "license", self.license.__dict__
+        yield "checksum", self.checksum
+        yield "size", self.size
+        yield "url", self.url
+        yield "labels", self.labels
+        yield "benchmarks", (e.__dict__ for e in self.benchmarks)
+        yield "properties", self.properties
+        yield "hyperParameters", self.hyper_parameters
+        yield "metrics", (e.__dict__ for e in self.metrics)
+        yield "dataSources", (_source_to_dict(e) for e in self.data_sources)
+        yield "codeSources", (_source_to_dict(e) for e in self.code_sources)
 
         if self.description is not None:
             from html import escape
-            obj["description"] = escape(self.description)
+            yield "description", escape(self.description)
 
-        return obj
-
-    def save(self, name: str):
+    def dump(self, fp: TextIO, compact: bool = False):
+        """
+        Writes the glass box model as json to the given text stream (e.g. a file or socket.makefile("w")).
+        The json document is written in chunks without building the whole document in memory.
         """
-        Saves the glassbox model as a json file.
+        indent = None if compact else 4
+        encoder = json.JSONEncoder(indent=indent, separators=(",", ":") if compact else (",", ": "))
+        colon = ":" if compact else ": "
+        buffer = []
+        buffered = 0
+
+        def emit(chunk: str):
+            nonlocal buffered
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= 65536:
+                fp.write("".join(buffer))
+                buffer.clear()
+                buffered = 0
+
+        def key(value: any) -> str:
+            # non string keys are converted like json.dumps does
+            return encoder.encode(value if isinstance(value, str) else encoder.encode(value)) + colon
+
+        def write(value: any, level: int):
+            if isinstance(value, dict):
+                sequence("{", "}", ((key(k), v) for k, v in value.items()), level)
+            elif isinstance(value, (list, tuple, Iterator)):
+                sequence("[", "]", (("", v) for v in value), level)
+            else:
+                emit(encoder.encode(value))
+
+        def encode_batch(batch: list, level: int) -> str:
+            # encodes flat list elements in a single call and strips the surrounding brackets
+            text = encoder.encode(batch)
+            if indent is None:
+                return text[1:-1]
+            return text[2 + indent:-2].replace("\n", "\n" + " " * (indent * level))
+
+        def sequence(start: str, end: str, items: Iterator[Tuple[str, any]], level: int):
+            separator = "," if indent is None else ",\n" + " " * (indent * (level + 1))
+            empty = True
+            batch = []
+
+            def element(chunk: str):
+                nonlocal empty
+                emit(separator[1:] if empty else separator)
+                emit(chunk)
+                empty = False
+
+            emit(start)
+            for prefix, item in items:
+                if len(prefix) == 0 and _is_flat(item):
+                    batch.append(item)
+                    if len(batch) >= 1024:
+                        element(encode_batch(batch, level))
+                        batch.clear()
+                    continue
+                if len(batch) > 0:
+                    element(encode_batch(batch, level))
+                    batch.clear()
+                element(prefix)
+                write(item, level + 1)
+            if len(batch) > 0:
+                element(encode_batch(batch, level))
+            if not empty and indent is not None:
+                emit("\n" + " " * (indent * level))
+            emit(end)
+
+        sequence("{", "}", ((key(k), v) for k, v in self._items()), 0)
+        fp.write("".join(buffer))
+
+    def save(self, name: str, compact: bool = False, compress: bool = False):
         """
-        with open(name, "w") as outfile:
-            outfile.write(json.dumps(self.as_dict(), indent=4))
+        Saves the glassbox model as a json file. The file is gzip compressed if compress is True.
+        """
+        if compress:
+            import gzip
+            with gzip.open(name, "wt", encoding="utf-8") as outfile:
+                self.dump(outfile, compact)
+        else:
+            with open(name, "w") as outfile:
+                self.dump(outfile, compact)
+
+
+_SCALARS = (str, int, float, bool, type(None))
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def read_json(path: str) -> dict:
+    """
+    Reads a json file which is gzip compressed or not. Compression is detected by the
+    gzip magic bytes because saved files keep whatever name they were given.
+    """
+    with open(path, "rb") as file:
+        compressed = file.read(2) == _GZIP_MAGIC
+    if compressed:
+        import gzip
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return json.load(file)
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def _is_flat(value: any) -> bool:
+    if isinstance(value, _SCALARS):
+        return True
+    return isinstance(value, dict) and all(isinstance(e, _SCALARS) for e in value.values())
+
+
+def _source_to_dict(data: Tuple[any, Purposes, Optional[Logging]]) -> dict:
+    purposes = data[1] if isinstance(data[1], list) else [data[1]]
+
+    obj = {"purposes": [e.name.lower() for e in purposes]}
+    for k, v in data[0].__dict__.items():
+        if v is not None:
+            obj[k] = v
+    if data[2] is not None:
+        obj["logging"] = data[2].as_dict()
+    return obj
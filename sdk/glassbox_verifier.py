@@ -0,0 +1,143 @@
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from sdk.glassbox_model import GlassBoxModel
+
+
+@dataclass(frozen=True)
+class Verification:
+    """
+    The result of a url reachability check.
+    """
+    url: str
+    reachable: bool
+    status: Optional[int] = None
+    error: Optional[str] = None
+
+
+class UrlVerifier:
+    """
+    The url verifier checks the reachability of all traceable urls of glass box models.
+    Urls are checked in parallel with HEAD requests over pooled connections and the
+    results are cached for the given time to live. Failed checks are cached for the shorter
+    failure time to live (0 disables caching them) because they are often transient.
+    The cache holds at most max_entries results. Once it is full, expired results are
+    dropped and then the oldest ones until a quarter of the capacity is free.
+    """
+
+    def __init__(self, parallelism: int = 16, timeout: float = 10.0, ttl: float = 3600.0, failure_ttl: float = 60.0,
+                 max_entries: int = 65536):
+        self.timeout = timeout
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.max_entries = max_entries
+        self.executor = ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="glassbox-verifier")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=parallelism, pool_maxsize=parallelism)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._cache: Dict[str, Tuple[float, Verification]] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown()
+        self.session.close()
+
+    @staticmethod
+    def urls(model: GlassBoxModel) -> List[str]:
+        """
+        Returns the traceable urls of the given model.
+        """
+        urls = [model.url] if model.url is not None else []
+        urls.extend(e.url for e in model.benchmarks)
+        urls.extend(e[0].url for e in model.data_sources)
+        urls.extend(e[0].url for e in model.code_sources)
+        return list(dict.fromkeys(e for e in urls if e is not None))
+
+    def verify(self, model: GlassBoxModel) -> Dict[str, Verification]:
+        """
+        Verifies all traceable urls of the given model and warns about unreachable ones.
+        """
+        return self.verify_urls(self.urls(model))
+
+    def verify_all(self, models: Iterable[GlassBoxModel]) -> Dict[str, Verification]:
+        """
+        Verifies all traceable urls of the given models at once.
+        """
+        return self.verify_urls([url for model in models for url in self.urls(model)])
+
+    def verify_urls(self, urls: Iterable[str]) -> Dict[str, Verification]:
+        """
+        Verifies the given urls and warns about unreachable ones.
+        """
+        futures = {url: self._submit(url) for url in dict.fromkeys(urls)}
+        result = {url: future.result() for url, future in futures.items()}
+
+        for verification in result.values():
+            if not verification.reachable:
+                logging.warning(f"url {verification.url} is not reachable "
+                                f"({verification.error or verification.status})")
+        return result
+
+    def _submit(self, url: str) -> Future:
+        with self._lock:
+            cached = self._cache.get(url)
+            if cached is not None:
+                if time.monotonic() < cached[0]:
+                    future = Future()
+                    future.set_result(cached[1])
+                    return future
+                del self._cache[url]
+
+            # concurrent checks of the same url share a single request
+            future = self._pending.get(url)
+            if future is None:
+                future = self.executor.submit(self._check, url)
+                self._pending[url] = future
+            return future
+
+    def _check(self, url: str) -> Verification:
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in (405, 501):
+                # some servers do not support HEAD requests
+                with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                    pass
+            verification = Verification(url, response.status_code < 400, response.status_code)
+        except requests.RequestException as e:
+            verification = Verification(url, False, error=type(e).__name__)
+
+        ttl = self.ttl if verification.reachable else self.failure_ttl
+        with self._lock:
+            if ttl > 0:
+                now = time.monotonic()
+                self._cache.pop(url, None)
+                if len(self._cache) >= self.max_entries:
+                    self._evict(now)
+                self._cache[url] = (now + ttl, verification)
+            self._pending.pop(url, None)
+        return verification
+
+    def _evict(self, now: float):
+        self._cache = {k: v for k, v in self._cache.items() if now < v[0]}
+        # evicts down to three quarters of the capacity so that full caches are not swept on every check.
+        # dicts keep the insertion order, so the first entries are the oldest
+        excess = len(self._cache) - self.max_entries * 3 // 4
+        for url in list(itertools.islice(self._cache, max(excess, 0))):
+            del self._cache[url]
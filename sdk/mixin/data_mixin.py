@@ -1,7 +1,17 @@
+import base64
+import os
 from io import BytesIO
+from typing import Iterable, List, Optional, Tuple, Union
 
+from PIL import Image as PILImage
 from PIL.Image import Image
 
+ImageSource = Union[Image, str, os.PathLike]
+Size = Tuple[int, int]
+
+# multiple of 3 so that the base64 encoded chunks can be concatenated
+_CHUNK_SIZE = 3 * 65536
+
 
 class DataMixin:
 
@@ -24,13 +34,72 @@ class DataMixin:
         return data
 
     def to_base64(self, image: Image):
-        import base64
-
         buff = BytesIO()
         image.save(buff, format=image.format)
         return base64.b64encode(buff.getvalue()).decode("utf-8")
 
+    def to_base64_batch(self,
+                        images: Iterable[ImageSource],
+                        max_size: Optional[Size] = None,
+                        workers: Optional[int] = None,
+                        reuse_source: bool = False) -> List[str]:
+        """
+        Encodes the given images (PIL images or file paths) as base64 strings.
+        The bytes of the given file paths are used as they are unless the image exceeds the given
+        max size, in which case a thumbnail is encoded. PIL images are re-encoded in their format
+        unless reuse_source is set, which treats images loaded from a file like their file path and
+        must therefore only be used for images which were not modified after loading.
+        The images are encoded on a process pool with the given number of workers
+        (0 encodes on the calling thread).
+        """
+        tasks = [_to_task(e, reuse_source) for e in images]
+        if workers == 0 or len(tasks) < 2:
+            return [_encode(task, max_size) for task in tasks]
+
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(workers or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(tasks) // (4 * workers))
+            return list(executor.map(_encode, tasks, [max_size] * len(tasks), chunksize=chunksize))
+
     def checksum(self, data) -> str:
         import hashlib
         import pickle
         return hashlib.md5(pickle.dumps(data)).hexdigest()
+
+
+def _to_task(image: ImageSource, reuse_source: bool) -> Union[Tuple[Image, str], str]:
+    if isinstance(image, Image):
+        filename = getattr(image, "filename", None)
+        if reuse_source and filename and image.format is not None and os.path.isfile(filename):
+            # file backed images are passed to the workers by path instead of by pixel data
+            return filename
+        # the format is not preserved when images are pickled for the workers
+        return image, image.format or "PNG"
+    return os.fspath(image)
+
+
+def _encode(task: Union[Tuple[Image, str], str], max_size: Optional[Size]) -> str:
+    if isinstance(task, str):
+        with PILImage.open(task) as image:
+            # opening an image only parses its header
+            if max_size is None or (image.width <= max_size[0] and image.height <= max_size[1]):
+                return _encode_file(task)
+            image.load()
+            return _encode_image(image, image.format, max_size)
+    return _encode_image(task[0], task[1], max_size)
+
+
+def _encode_file(path: str) -> str:
+    with open(path, "rb") as file:
+        return "".join(base64.b64encode(chunk).decode("ascii") for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""))
+
+
+def _encode_image(image: Image, image_format: str, max_size: Optional[Size]) -> str:
+    if max_size is not None and (image.width > max_size[0] or image.height > max_size[1]):
+        image = image.copy()
+        image.thumbnail(max_size)
+
+    buff = BytesIO()
+    image.save(buff, format=image_format)
+    return base64.b64encode(buff.getbuffer()).decode("utf-8")
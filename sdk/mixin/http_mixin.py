@@ -1,15 +1,20 @@
 import base64
 import hmac
 import json
-from typing import Optional
-
-import requests
+import os
+import threading
+from typing import Iterator, Optional
 
+from sdk.__spi__.json_stream import iter_json_array
+from sdk.__spi__.token_store import Token, token_key, token_expiry, is_valid
+from sdk.__spi__.transport import Transport
 from sdk.glassbox_config import GlassBoxConfig, HMACCredentials, JWTCredentials
 
 
 class HttpMixin:
     config: GlassBoxConfig
+    _transport: Optional[Transport] = None
+    _token: Optional[Token] = None
 
     def hmac(self, key: str, message: str):
         _hmac = hmac.new(key=key.encode(), digestmod="sha256")
@@ -27,26 +32,64 @@ class HttpMixin:
         if authorized:
             headers["Authorization"] = self._get_token(message)
 
-        text = requests.put(self.config.url + "/" + path, data=message, headers=headers).text
-        response = json.loads(text) if len(text) > 0 else None
-        if response is not None and "errorMessage" in response:
-            raise ValueError(response["errorMessage"])
+        return self._request("PUT", path, message, headers, idempotent=True)
 
-        return response
+    def http_post(self, path: str, data: {}, idempotent: bool = False):
+        message = self.to_json(data)
 
-    def http_post(self, path: str, data: {}):
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self._get_token(message)
+        }
+        return self._request("POST", path, message, headers, idempotent=idempotent)
+
+    def http_post_stream(self, path: str, data: {}, idempotent: bool = False) -> Iterator:
+        """
+        Posts the given data and yields the elements of the json array response while it is received.
+        """
         message = self.to_json(data)
 
         headers = {
             "Content-Type": "application/json",
             "Authorization": self._get_token(message)
         }
-        text = requests.post(self.config.url + "/" + path, data=message, headers=headers).text
-        response = json.loads(text) if len(text) > 0 else None
-        if response is not None and "errorMessage" in response:
-            raise ValueError(response["errorMessage"])
+        response = self._get_transport().request("POST", self.config.url + "/" + path, message, headers,
+                                                 idempotent, stream=True)
+        with response:
+            if response.status_code >= 400:
+                self._parse(response)
+            # yields the chunks as they are received instead of waiting for a fixed size
+            yield from iter_json_array(response.iter_content(chunk_size=None))
+
+    def _get_transport(self) -> Transport:
+        transport = self._transport
+        if transport is not None and transport.pid == os.getpid():
+            return transport
+
+        # concurrent first requests must share one transport and thereby its rate limits
+        with _TRANSPORT_LOCK:
+            # connections must not be shared with the parent of a forked process
+            if self._transport is None or self._transport.pid != os.getpid():
+                self._transport = Transport(self.config.policy)
+            return self._transport
+
+    def _request(self, method: str, path: str, message: str, headers: dict, idempotent: bool):
+        response = self._get_transport().request(method, self.config.url + "/" + path, message, headers, idempotent)
+        return self._parse(response)
+
+    # noinspection PyMethodMayBeStatic
+    def _parse(self, response):
+        try:
+            body = response.json() if len(response.content) > 0 else None
+        except ValueError:
+            response.raise_for_status()
+            raise
 
-        return response
+        if isinstance(body, dict) and "errorMessage" in body:
+            raise ValueError(body["errorMessage"])
+        response.raise_for_status()
+
+        return body
 
     def _get_token(self, message):
         credentials = self.config.credentials
@@ -54,10 +97,52 @@ class HttpMixin:
             return "HMAC " + credentials.api_key + ":" + self.hmac(credentials.api_secret, message)
 
         if isinstance(credentials, JWTCredentials):
-            jwt = self.http_put("signin", {
-                "username": credentials.username,
-                "password": credentials.password
-            }, authorized=False)
-            return "Bearer " + jwt["idToken"]
+            return "Bearer " + self._get_jwt(credentials)
 
         raise ValueError("invalid credentials")
+
+    def _get_jwt(self, credentials: JWTCredentials) -> str:
+        if is_valid(self._token):
+            return self._token[0]
+
+        with _SIGN_IN_LOCK:
+            if is_valid(self._token):
+                return self._token[0]
+
+            store = self.config.token_store
+            if store is None:
+                self._token = self._sign_in(credentials)
+                return self._token[0]
+
+            key = token_key(self.config.url, credentials.username)
+            with store.lock():
+                token = store.get(key)
+                if not is_valid(token):
+                    token = self._sign_in(credentials)
+                    store.put(key, token)
+            self._token = token
+            return token[0]
+
+    def _sign_in(self, credentials: JWTCredentials) -> Token:
+        jwt = self.http_put("signin", {
+            "username": credentials.username,
+            "password": credentials.password
+        }, authorized=False)
+        return jwt["idToken"], token_expiry(jwt["idToken"])
+
+    def __getstate__(self):
+        # connections are not shared with other processes
+        state = self.__dict__.copy()
+        state.pop("_transport", None)
+        return state
+
+
+def _reset_lock():
+    global _SIGN_IN_LOCK, _TRANSPORT_LOCK
+    _SIGN_IN_LOCK = threading.Lock()
+    _TRANSPORT_LOCK = threading.Lock()
+
+
+_SIGN_IN_LOCK = threading.Lock()
+_TRANSPORT_LOCK = threading.Lock()
+os.register_at_fork(after_in_child=_reset_lock)
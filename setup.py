@@ -2,10 +2,10 @@ import os
 # read the contents of your README file
 from pathlib import Path
 
-import pkg_resources
 from setuptools import find_packages, setup
 
-long_description = Path(__file__).with_name("README.md").read_text()
+readme = Path(__file__).with_name("README.md")
+long_description = readme.read_text() if readme.exists() else ""
 
 version = "0.1.0"
 
@@ -24,11 +24,14 @@ setup(
     keywords=['machine-learning', 'artificial-intelligence', 'explainable-ai'],
     setup_requires=['setuptools_scm'],
     include_package_data=True,
+    python_requires='>=3.10',
+    entry_points={
+        'console_scripts': ['glassbox=sdk.cli:main'],
+    },
     install_requires=[
-        str(r)
-        for r in pkg_resources.parse_requirements(
-            open(os.path.join(os.path.dirname(__file__), "requirements.txt"))
-        )
+        line.strip()
+        for line in open(os.path.join(os.path.dirname(__file__), "requirements.txt"))
+        if line.strip() and not line.startswith("#")
     ],
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -36,8 +39,8 @@ setup(
         'Topic :: Scientific/Engineering :: Artificial Intelligence',
         'License :: OSI Approved :: Apache Software License',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
     ],
 )
@@ -0,0 +1,145 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from sdk.__spi__.enumy import Property
+from sdk.__spi__.types import APACHE_2, Benchmark, Dataset, GitCommit
+from sdk.cli import create_glassbox, main
+from sdk.glassbox_config import ModelRef
+from sdk.glassbox_model import GlassBoxModel, Purpose
+from tests.fake_backend import FakeBackend, FakeHandler
+
+
+class ModelHandler(FakeHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        model = json.loads(self.read_body())
+        self.server.models.append(model)
+        self.respond({"errorMessage": "invalid model"} if model["name"] == "invalid" else {})
+
+    def do_POST(self):
+        self.read_body()
+        if self.server.released is None:
+            self.respond(self.server.models)
+            return
+
+        # sends the first model in its own chunk and holds back the others until the test releases them
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        models = [json.dumps(e) for e in self.server.models]
+        self.write_chunk(f"[{models[0]},".encode())
+        if self.server.released.wait(5):
+            self.write_chunk(f"{','.join(models[1:])}]".encode())
+            self.write_chunk(b"")
+
+    def write_chunk(self, data: bytes):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+def create_model(name: str) -> GlassBoxModel:
+    model = GlassBoxModel(ModelRef("leftshiftone", name, "1.0.0"))
+    model.checksum = "checksum"
+    model.size = "1000"
+    model.url = f"https://leftshiftone/{name}/1.0.0"
+    model.license = APACHE_2
+    model.description = "<b>model</b>"
+    model.add_label("translation")
+    model.add_benchmark(Benchmark("bleu", "23.5", "https://opus.nlpl.eu"))
+    model.add_properties({Property.SEED_VALUE.value: 1, Property.PARAMETER_SIZE.value: 2})
+    model.add_hyper_parameter("vocab_size", "58101")
+    model.add_data(Dataset(url="https://opus.nlpl.eu"), Purpose.TRAIN)
+    model.add_code(GitCommit("https://github.com/Helsinki-NLP/OPUS-MT-train", "4b0d49d"), Purpose.TRAIN)
+    return model
+
+
+class CliTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeBackend(ModelHandler).start(self)
+        self.server.models, self.server.released = [], None
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        for name in ["a", "b", "invalid"]:
+            create_model(name).save(os.path.join(self.directory, f"{name}.json"))
+
+        environ = mock.patch.dict(os.environ, {"API_KEY": "key", "API_SECRET": "secret",
+                                               "XDG_CACHE_HOME": os.path.join(self.directory, "cache")})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def run_cli(self, *args) -> (int, str, str):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main(["--url", self.server.url, *args])
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_push_resume(self):
+        state = os.path.join(self.directory, "push.state")
+
+        code, _, stderr = self.run_cli("push", self.directory, "--state", state, "--workers", "2")
+        self.assertEqual(code, 1)
+        self.assertIn("2 succeeded, 1 failed", stderr)
+        self.assertEqual(sorted(e["name"] for e in self.server.models), ["a", "b", "invalid"])
+        self.assertEqual(self.server.models[0]["description"], "&lt;b&gt;model&lt;/b&gt;")
+        self.assertEqual(self.server.models[0]["license"], APACHE_2.__dict__)
+
+        code, _, stderr = self.run_cli("push", self.directory, "--state", state)
+        self.assertIn("2 skipped, 0 succeeded, 1 failed", stderr)
+        self.assertEqual(len(self.server.models), 4)
+
+    def test_push_dry_run_jsonl(self):
+        manifests = os.path.join(self.directory, "models.jsonl")
+        with open(manifests, "w") as file:
+            for name in ["a", "b"]:
+                file.write(json.dumps(create_model(name).as_dict()) + "\n")
+
+        code, _, stderr = self.run_cli("push", manifests, "--dry-run")
+        self.assertEqual(code, 0)
+        self.assertIn("manifests/s", stderr)
+        self.assertEqual(self.server.models, [])
+
+    def test_push_bad_manifest(self):
+        manifests = os.path.join(self.directory, "models.jsonl")
+        with open(manifests, "w") as file:
+            file.write(json.dumps(create_model("a").as_dict()) + "\n{bad\n")
+            file.write(json.dumps(create_model("b").as_dict()) + "\n")
+
+        code, _, stderr = self.run_cli("push", manifests, "--dry-run")
+        self.assertEqual(code, 1)
+        self.assertIn(f"{manifests}:2: JSONDecodeError", stderr)
+        self.assertIn("2 succeeded, 1 failed", stderr)
+
+    def test_search(self):
+        self.server.models = [{"name": "a"}, {"name": "b"}]
+        code, stdout, _ = self.run_cli("search", "--group", "leftshiftone")
+        self.assertEqual(code, 0)
+        self.assertEqual([json.loads(e) for e in stdout.splitlines()], self.server.models)
+
+    def test_hmac_without_token_cache(self):
+        # the cache directory cannot be created below a file
+        cache = os.path.join(self.directory, "a.json")
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache}):
+            code, _, _ = self.run_cli("search", "--group", "leftshiftone")
+        self.assertEqual(code, 0)
+
+    def test_search_streams(self):
+        self.server.models = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+        self.server.released = threading.Event()
+        self.addCleanup(self.server.released.set)
+
+        models = create_glassbox(self.server.url).iter_models(group="leftshiftone")
+        # the first model is available before the backend has sent the whole response
+        self.assertEqual(next(models), {"name": "a"})
+        self.server.released.set()
+        self.assertEqual(list(models), [{"name": "b"}, {"name": "c"}])
@@ -0,0 +1,73 @@
+import base64
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from PIL import Image
+
+from sdk.mixin.data_mixin import DataMixin
+
+
+class DataMixinTest(unittest.TestCase, DataMixin):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.paths = []
+        for i, image_format in enumerate(["PNG", "JPEG", "PNG"]):
+            path = os.path.join(directory.name, f"image{i}.{image_format.lower()}")
+            Image.new("RGB", (64 + i * 64, 48), color=(i * 80, 100, 200)).save(path, format=image_format)
+            self.paths.append(path)
+
+    def original(self, path: str) -> str:
+        with open(path, "rb") as file:
+            return base64.b64encode(file.read()).decode("utf-8")
+
+    def decode(self, data: str) -> Image.Image:
+        image = Image.open(BytesIO(base64.b64decode(data)))
+        image.load()
+        return image
+
+    def test_batch_reuses_files(self):
+        self.assertEqual(self.to_base64_batch(self.paths[:2], workers=0), [self.original(e) for e in self.paths[:2]])
+
+        images = [Image.open(self.paths[0]), Image.open(self.paths[1])]
+        self.assertEqual(self.to_base64_batch(images, workers=0, reuse_source=True),
+                         [self.original(e) for e in self.paths[:2]])
+
+    def test_batch_modified_image(self):
+        thumbnail = Image.open(self.paths[1])
+        thumbnail.thumbnail((10, 10))
+        pasted = Image.open(self.paths[0])
+        pasted.paste((255, 0, 0), (0, 0, 8, 8))
+
+        for workers in [0, 2]:
+            encoded = self.to_base64_batch([thumbnail, pasted], workers=workers)
+            with self.decode(encoded[0]) as image:
+                self.assertEqual((image.format, image.width), ("JPEG", 10))
+            with self.decode(encoded[1]) as image:
+                self.assertEqual(image.getpixel((0, 0)), (255, 0, 0))
+                self.assertEqual(image.size, (64, 48))
+
+    def test_batch_thumbnail(self):
+        encoded = self.to_base64_batch(self.paths, max_size=(100, 100), workers=0)
+
+        self.assertEqual(encoded[0], self.original(self.paths[0]))
+        for data in encoded[1:]:
+            with Image.open(BytesIO(base64.b64decode(data))) as image:
+                self.assertLessEqual(image.width, 100)
+        with Image.open(BytesIO(base64.b64decode(encoded[1]))) as image:
+            self.assertEqual(image.format, "JPEG")
+
+    def test_batch_in_memory_image(self):
+        image = Image.new("RGB", (32, 32))
+        encoded = self.to_base64_batch([image], workers=0)[0]
+        with Image.open(BytesIO(base64.b64decode(encoded))) as decoded:
+            self.assertEqual((decoded.format, decoded.size), ("PNG", (32, 32)))
+
+    def test_batch_process_pool(self):
+        images = self.paths + [Image.new("RGB", (16, 16))]
+        self.assertEqual(self.to_base64_batch(images, max_size=(100, 100), workers=2),
+                         self.to_base64_batch(images, max_size=(100, 100), workers=0))
@@ -0,0 +1,60 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from unittest import TestCase
+
+
+class FakeBackend(ThreadingHTTPServer):
+    """
+    A local stand-in for the glassbox backend which dispatches requests to the given handler class.
+    """
+
+    def __init__(self, handler: type):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+    def start(self, test: TestCase) -> 'FakeBackend':
+        """
+        Starts serving and stops the backend once the given test has finished.
+        """
+        self.__enter__()
+        test.addCleanup(self.__exit__)
+        return self
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+
+    def read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def respond(self, obj: any, status: int = 200, headers: Optional[dict] = None):
+        """
+        Responds with the given object as json body. Bytes are sent as they are and None as empty body.
+        """
+        if isinstance(obj, bytes):
+            body = obj
+        else:
+            body = json.dumps(obj).encode() if obj is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
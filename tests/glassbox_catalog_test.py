@@ -0,0 +1,76 @@
+import unittest
+
+from sdk.glassbox_catalog import ANY_VARIANT, GlassBoxCatalog, parse_range
+from sdk.glassbox_config import ModelRef
+
+
+def model(name: str, version: str, variant=None, labels=None):
+    return {"group": "leftshiftone", "name": name, "version": version, "variant": variant, "labels": labels or []}
+
+
+class FakeGlassBox:
+
+    def __init__(self, models):
+        self.models = models
+        self.calls = 0
+
+    def search_model(self):
+        self.calls += 1
+        return self.models
+
+
+class GlassBoxCatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.glassbox = FakeGlassBox([
+            model("opus-mt-it-en", "1.0.0", labels=["translation"]),
+            model("opus-mt-it-en", "1.4.2", labels=["translation", "onnx"]),
+            model("opus-mt-it-en", "1.10.0", variant="quantized", labels=["translation", "onnx"]),
+            model("opus-mt-it-en", "2.0.0", labels=["translation"]),
+            model("opus-mt-de-en", "0.3.1", labels=["translation"]),
+            model("bert-qa", "1.0.0", labels=["question-answering"]),
+        ])
+        self.catalog = GlassBoxCatalog()
+        self.addCleanup(self.catalog.close)
+        self.assertEqual(self.catalog.sync(self.glassbox), 6)
+
+    def test_resolve(self):
+        self.assertEqual(self.catalog.resolve("leftshiftone", "opus-mt-it-en", "1.x"),
+                         ModelRef("leftshiftone", "opus-mt-it-en", "1.4.2"))
+        self.assertEqual(self.catalog.resolve("leftshiftone", "opus-mt-it-en", "1.x", variant="quantized"),
+                         ModelRef("leftshiftone", "opus-mt-it-en", "1.10.0", "quantized"))
+        self.assertEqual(self.catalog.resolve("leftshiftone", "opus-mt-it-en", "1.x", variant=ANY_VARIANT),
+                         ModelRef("leftshiftone", "opus-mt-it-en", "1.10.0", "quantized"))
+        self.assertEqual(self.catalog.resolve("leftshiftone", "opus-mt-it-en", "~1.4.0"),
+                         ModelRef("leftshiftone", "opus-mt-it-en", "1.4.2"))
+        self.assertEqual(self.catalog.resolve("leftshiftone", "opus-mt-it-en").version, "2.0.0")
+        self.assertIsNone(self.catalog.resolve("leftshiftone", "opus-mt-it-en", "3.x"))
+
+    def test_find(self):
+        onnx = self.catalog.find(labels=["onnx", "translation"])
+        self.assertEqual([e.version for e in onnx], ["1.10.0", "1.4.2"])
+        self.assertEqual([e.version for e in self.catalog.find(labels=["onnx"], variant=None)], ["1.4.2"])
+
+        prefixed = self.catalog.find(prefix="opus-mt-", version="<1.0.0 || >=2.0.0")
+        self.assertEqual([e.to_string() for e in prefixed],
+                         ["leftshiftone:opus-mt-it-en:2.0.0", "leftshiftone:opus-mt-de-en:0.3.1"])
+
+        self.assertEqual(self.catalog.get(ModelRef("leftshiftone", "bert-qa", "1.0.0"))["labels"],
+                         ["question-answering"])
+
+    def test_sync_changes(self):
+        self.assertEqual(self.catalog.sync(self.glassbox), 0)
+
+        self.glassbox.models = self.glassbox.models[1:] + [model("bert-qa", "1.1.0")]
+        self.glassbox.models[0] = model("opus-mt-it-en", "1.4.2", labels=["translation"])
+        self.assertEqual(self.catalog.sync(self.glassbox), 3)
+        self.assertEqual(self.catalog.find(labels=["onnx"]),
+                         [ModelRef("leftshiftone", "opus-mt-it-en", "1.10.0", "quantized")])
+        self.assertIsNone(self.catalog.resolve("leftshiftone", "opus-mt-it-en", "1.0.0"))
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range("1.x"), [((1, 0, 0), (2, 0, 0))])
+        self.assertEqual(parse_range("^0.2.3"), [((0, 2, 3), (0, 3, 0))])
+        self.assertEqual(parse_range(">=1.0.0 <1.5.0"), [((1, 0, 0), (1, 5, 0))])
+        with self.assertRaises(ValueError):
+            parse_range("latest")
@@ -0,0 +1,41 @@
+import dataclasses
+import pickle
+import unittest
+
+from sdk.glassbox_config import ModelRef, _intern
+
+
+class ModelRefTest(unittest.TestCase):
+
+    def test_from_string(self):
+        self.assertEqual(ModelRef.from_string("leftshiftone:opus-mt-it-en:1.0.0"),
+                         ModelRef("leftshiftone", "opus-mt-it-en", "1.0.0"))
+        self.assertEqual(ModelRef.from_string("leftshiftone:opus-mt-it-en:1.0.0@onnx").variant, "onnx")
+
+        for invalid in ["leftshiftone:opus-mt-it-en", "leftshiftone:opus-mt-it-en:1.0", "x leftshiftone:a:1.0.0"]:
+            with self.assertRaises(ValueError):
+                ModelRef.from_string(invalid)
+
+    def test_to_string(self):
+        for string in ["leftshiftone:opus-mt-it-en:1.0.0", "leftshiftone:opus-mt-it-en:1.0.0@onnx"]:
+            self.assertEqual(ModelRef.from_string(string).to_string(), string)
+        self.assertEqual(ModelRef("a", "b", "1.2.3", "c").to_string(), "a:b:1.2.3@c")
+
+    def test_hashable(self):
+        model_ref = ModelRef("leftshiftone", "opus-mt-it-en", "1.0.0")
+        refs = {model_ref: 1}
+        self.assertEqual(refs[ModelRef.from_string("leftshiftone:opus-mt-it-en:1.0.0")], 1)
+        self.assertEqual(pickle.loads(pickle.dumps(model_ref)), model_ref)
+        self.assertFalse(hasattr(model_ref, "__dict__"))
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            model_ref.version = "2.0.0"
+
+    def test_intern(self):
+        model_ref = ModelRef.intern(ModelRef("leftshiftone", "intern", "1.0.0"))
+        self.assertIs(ModelRef.from_string("leftshiftone:intern:1.0.0", intern=True), model_ref)
+
+    def test_intern_bounded(self):
+        for i in range(70000):
+            ModelRef.intern(ModelRef("leftshiftone", "intern", f"1.0.{i}"))
+        self.assertLessEqual(_intern.cache_info().currsize, _intern.cache_info().maxsize)
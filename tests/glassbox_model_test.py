@@ -1,10 +1,14 @@
+import io
+import json
 import os
+import tempfile
 import time
 import unittest
 
 from sdk.__spi__ import BETA_API_URL
 from sdk.__spi__.enumy import Label, Property
-from sdk.__spi__.types import APACHE_2, GitCommit, Dataset, Benchmark
+from sdk.__spi__.types import APACHE_2, GitCommit, Dataset, Benchmark, Metric
+from sdk.__spi__.validation import Logging
 from sdk.glassbox import GlassBox, GlassBoxConfig
 from sdk.glassbox_config import ModelRef, HMACCredentials
 from sdk.glassbox_model import GlassBoxModel
@@ -203,3 +207,47 @@ Tools and resources for open translation services
 
         print(models)
         self.assertTrue(len(models) > 0)
+
+
+class GlassBoxModelSerializationTest(unittest.TestCase):
+
+    def model(self) -> GlassBoxModel:
+        model = GlassBoxModel(ModelRef("leftshiftone", "opus-mt-it-en", "1.0.0"))
+        model.checksum = "checksum"
+        model.size = "1000"
+        model.url = "https://leftshiftone/opus-mt-it-en/1.0.0"
+        model.license = APACHE_2
+        model.description = "<b>translation</b>\nmodel"
+        model.labels = ["translation", "onnx"]
+        model.benchmarks = [Benchmark("bleu", "23.5", "https://opus.nlpl.eu")]
+        model.properties = {Property.SEED_VALUE.value: 123, Property.PARAMETER_SIZE.value: 1000000}
+        model.hyper_parameters = {"vocab_size": "58101", "bad_words_ids": [[58100]], "pruned_heads": {}}
+        model.metrics = [Metric("accuracy", "0.9"), Metric("f1", "0.8", "0", "1")]
+        model.data_sources = [
+            (Dataset(url="https://opus.nlpl.eu"), Purpose.TRAIN, Logging({"system": "Linux"}, ["SUCCESS: a", "FAILURE: b"])),
+            (Dataset(url="https://opus.nlpl.eu/test"), [Purpose.TEST, Purpose.EVALUATE], None)
+        ]
+        model.code_sources = [(GitCommit("https://github.com/Helsinki-NLP/OPUS-MT-train", "4b0d49d"), Purpose.TRAIN, None)]
+        return model
+
+    def test_dump(self):
+        model = self.model()
+        expected = model.as_dict()
+
+        buffer = io.StringIO()
+        model.dump(buffer)
+        self.assertEqual(buffer.getvalue(), json.dumps(expected, indent=4))
+
+        buffer = io.StringIO()
+        model.dump(buffer, compact=True)
+        self.assertEqual(buffer.getvalue(), json.dumps(expected, separators=(",", ":")))
+
+    def test_save(self):
+        model = self.model()
+        with tempfile.TemporaryDirectory() as directory:
+            for name, compress in [("model.json", False), ("model.json.gz", True), ("compressed.json", True)]:
+                path = os.path.join(directory, name)
+                model.save(path, compact=compress, compress=compress)
+                loaded = GlassBoxModel.from_json(path)
+                self.assertEqual(loaded.hyper_parameters, model.hyper_parameters)
+                self.assertEqual([e.__dict__ for e in loaded.metrics], [e.__dict__ for e in model.metrics])
@@ -0,0 +1,93 @@
+import time
+import unittest
+from collections import Counter
+
+from sdk.__spi__.types import Benchmark, Dataset, GitCommit
+from sdk.glassbox_config import ModelRef
+from sdk.glassbox_model import GlassBoxModel, Purpose
+from sdk.glassbox_verifier import UrlVerifier
+from tests.fake_backend import FakeBackend, FakeHandler
+
+
+class VerifierHandler(FakeHandler):
+
+    def do_HEAD(self):
+        self.server.calls[("HEAD", self.path)] += 1
+        if self.path == "/no-head":
+            self.respond(None, 405)
+        else:
+            self.respond(None, 404 if self.path == "/missing" else 200)
+
+    def do_GET(self):
+        self.server.calls[("GET", self.path)] += 1
+        self.respond(None)
+
+
+class UrlVerifierTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeBackend(VerifierHandler)
+        self.server.calls = Counter()
+        self.server.start(self)
+        self.base = self.server.url
+
+        self.verifier = UrlVerifier(parallelism=4, timeout=2)
+        self.addCleanup(self.verifier.close)
+
+    def model(self, name: str) -> GlassBoxModel:
+        model = GlassBoxModel(ModelRef("leftshiftone", name, "1.0.0"))
+        model.url = f"{self.base}/{name}"
+        model.benchmarks = [Benchmark("bleu", "23.5", f"{self.base}/benchmark")]
+        model.data_sources = [(Dataset(f"{self.base}/missing"), Purpose.TRAIN, None)]
+        model.code_sources = [(GitCommit(f"{self.base}/no-head", "4b0d49d"), Purpose.TRAIN, None)]
+        return model
+
+    def test_verify(self):
+        with self.assertLogs(level="WARNING") as logs:
+            result = self.verifier.verify(self.model("a"))
+
+        self.assertEqual({url[len(self.base):]: e.reachable for url, e in result.items()},
+                         {"/a": True, "/benchmark": True, "/missing": False, "/no-head": True})
+        self.assertEqual(result[f"{self.base}/missing"].status, 404)
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(self.server.calls[("GET", "/no-head")], 1)
+
+    def test_cache(self):
+        result = self.verifier.verify_all([self.model("a"), self.model("b")])
+        self.assertEqual(len(result), 5)
+        self.verifier.verify(self.model("a"))
+
+        self.assertEqual(self.server.calls[("HEAD", "/benchmark")], 1)
+        self.assertEqual(self.server.calls[("HEAD", "/a")], 1)
+
+    def test_failure_ttl(self):
+        missing = f"{self.base}/missing"
+        with self.assertLogs(level="WARNING"):
+            self.verifier.verify_urls([missing])
+            self.verifier.verify_urls([missing])
+        self.assertEqual(self.server.calls[("HEAD", "/missing")], 1)
+
+        with UrlVerifier(parallelism=1, timeout=2, failure_ttl=0) as verifier, self.assertLogs(level="WARNING"):
+            verifier.verify_urls([missing])
+            verifier.verify_urls([missing])
+        self.assertEqual(self.server.calls[("HEAD", "/missing")], 3)
+
+    def test_cache_bounded(self):
+        with UrlVerifier(parallelism=1, timeout=2, max_entries=4) as verifier:
+            for name in ["a", "b", "c", "d", "e"]:
+                verifier.verify_urls([f"{self.base}/{name}"])
+            self.assertEqual(list(verifier._cache), [f"{self.base}/{name}" for name in ["b", "c", "d", "e"]])
+
+        with UrlVerifier(parallelism=1, timeout=2, ttl=0.5, max_entries=4) as verifier:
+            verifier.verify_urls([f"{self.base}/a", f"{self.base}/b"])
+            time.sleep(0.6)
+            verifier.verify_urls([f"{self.base}/a"])
+            self.assertEqual(list(verifier._cache), [f"{self.base}/b", f"{self.base}/a"])
+            for name in ["c", "d", "e"]:
+                verifier.verify_urls([f"{self.base}/{name}"])
+            self.assertEqual(list(verifier._cache), [f"{self.base}/{name}" for name in ["a", "c", "d", "e"]])
+
+    def test_unreachable(self):
+        result = self.verifier.verify_urls(["http://127.0.0.1:1/closed"])
+        self.assertFalse(result["http://127.0.0.1:1/closed"].reachable)
+        self.assertEqual(result["http://127.0.0.1:1/closed"].error, "ConnectionError")
@@ -0,0 +1,43 @@
+import json
+import unittest
+from unittest import mock
+
+from sdk.__spi__.json_stream import iter_json_array
+
+
+def chunked(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class JsonStreamTest(unittest.TestCase):
+
+    def test_chunks(self):
+        array = [{"name": "ü" * 3, "size": 12345}, None, 1.5e3, [1, [2]], "a,]", True, -7]
+        for indent in [None, 2]:
+            body = json.dumps(array, indent=indent, ensure_ascii=False).encode()
+            for size in [1, 2, 3, 7, len(body)]:
+                self.assertEqual(list(iter_json_array(chunked(body, size))), array)
+
+    def test_large_element(self):
+        array = [{"name": "a" * 2 ** 16}, 1]
+        body = json.dumps(array).encode()
+
+        with mock.patch.object(json.JSONDecoder, "raw_decode", autospec=True,
+                               side_effect=json.JSONDecoder.raw_decode) as raw_decode:
+            self.assertEqual(list(iter_json_array(chunked(body, 1024))), array)
+        # incomplete elements are only parsed again once the buffer has doubled
+        self.assertLess(raw_decode.call_count, 16)
+
+    def test_empty(self):
+        self.assertEqual(list(iter_json_array([])), [])
+        self.assertEqual(list(iter_json_array([b"null"])), [])
+        self.assertEqual(list(iter_json_array([b" [", b" ] "])), [])
+
+    def test_error_message(self):
+        with self.assertRaisesRegex(ValueError, "invalid request"):
+            list(iter_json_array(chunked(b'{"errorMessage": "invalid request"}', 4)))
+
+    def test_invalid(self):
+        for body in [b"[1,", b"[1 2]", b"[1,]", b'{"name": "a"}', b"[1] x", b"[]]"]:
+            with self.assertRaises(ValueError):
+                list(iter_json_array(chunked(body, 2)))
@@ -0,0 +1,26 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks.sdk_benchmark import StubBackend, compare, run
+from sdk.glassbox import GlassBox
+from sdk.glassbox_config import GlassBoxConfig, HMACCredentials
+
+
+class SdkBenchmarkTest(unittest.TestCase):
+
+    def test_stub_verifies_signature(self):
+        with StubBackend() as backend:
+            glassbox = GlassBox(GlassBoxConfig(backend.url, HMACCredentials("benchmark", "invalid")))
+            with self.assertRaisesRegex(ValueError, "invalid signature"):
+                glassbox.search_model()
+
+    def test_regression(self):
+        results = run(min_time=0.01)
+        self.assertIn("create_model", results)
+
+        slower = {name: {"ops": e["ops"] * 2} for name, e in results.items()}
+        with redirect_stdout(io.StringIO()) as stdout:
+            self.assertTrue(compare(results, results, 0.25))
+            self.assertFalse(compare(results, slower, 0.25))
+        self.assertIn("REGRESSION", stdout.getvalue())
@@ -0,0 +1,111 @@
+import base64
+import json
+import multiprocessing
+import os
+import stat
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from sdk.__spi__.token_store import FileTokenStore, TokenStore, token_expiry
+from sdk.glassbox import GlassBox
+from sdk.glassbox_config import GlassBoxConfig, JWTCredentials
+from tests.fake_backend import FakeBackend, FakeHandler
+
+
+def create_jwt(expiry: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expiry}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class SignInHandler(FakeHandler):
+
+    def do_PUT(self):
+        self.read_body()
+        with self.server.lock:
+            self.server.sign_ins += 1
+        # slow sign ins make concurrent sign ins of the workers likely
+        time.sleep(0.1)
+        self.respond({"idToken": create_jwt(time.time() + 3600)})
+
+    def do_POST(self):
+        self.read_body()
+        authorized = self.headers["Authorization"].startswith("Bearer header.")
+        self.respond([] if authorized else {"errorMessage": "unauthorized"})
+
+
+def search(glassbox: GlassBox):
+    return glassbox.search_model()
+
+
+class TokenStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeBackend(SignInHandler)
+        self.server.sign_ins = 0
+        self.server.start(self)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.store = FileTokenStore(os.path.join(self.directory, "tokens.json"))
+
+    def glassbox(self, store=None) -> GlassBox:
+        return GlassBox(GlassBoxConfig(self.server.url, JWTCredentials("user", "password"), token_store=store))
+
+    def test_token_reused(self):
+        glassbox = self.glassbox()
+        for _ in range(3):
+            self.assertEqual(glassbox.search_model(), [])
+        self.assertEqual(self.server.sign_ins, 1)
+
+    def test_worker_pool(self):
+        for method in ["fork", "spawn"]:
+            with self.subTest(method):
+                self.server.sign_ins = 0
+                if os.path.exists(self.store.path):
+                    os.unlink(self.store.path)
+
+                glassbox = self.glassbox(self.store)
+                with multiprocessing.get_context(method).Pool(4) as pool:
+                    self.assertEqual(pool.map(search, [glassbox] * 16), [[]] * 16)
+                self.assertEqual(self.server.sign_ins, 1)
+
+    def test_forked_after_use(self):
+        glassbox = self.glassbox(self.store)
+        glassbox.search_model()
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            self.assertEqual(pool.map(search, [glassbox] * 4), [[]] * 4)
+        self.assertEqual(self.server.sign_ins, 1)
+
+    def test_default_path(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.directory}):
+            store = FileTokenStore()
+        self.assertEqual(store.path, os.path.join(self.directory, "glassbox", "tokens.json"))
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.dirname(store.path)).st_mode), 0o700)
+
+        store.put("key", ("token", time.time() + 3600))
+        self.assertEqual(store.get("key")[0], "token")
+        self.assertEqual(stat.S_IMODE(os.stat(store.path).st_mode), 0o600)
+
+    def test_rejects_shared_files(self):
+        self.store.put("key", ("token", time.time() + 3600))
+        os.chmod(self.store.path, 0o644)
+        with self.assertRaises(PermissionError):
+            self.store.get("key")
+
+        # a cache directory which other users can access is not used
+        shared = os.path.join(self.directory, "glassbox")
+        os.mkdir(shared)
+        os.chmod(shared, 0o755)
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.directory}), self.assertRaises(PermissionError):
+            FileTokenStore()
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            TokenStore()
+
+    def test_token_expiry(self):
+        self.assertEqual(token_expiry(create_jwt(1234.0)), 1234.0)
+        self.assertGreater(token_expiry("invalid"), time.time())
@@ -0,0 +1,121 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from sdk.__spi__.transport import Transport, TransportPolicy, CircuitOpenError, CircuitBreaker, retry_after
+from sdk.glassbox import GlassBox
+from sdk.glassbox_config import GlassBoxConfig, HMACCredentials
+from tests.fake_backend import FakeBackend, FakeHandler
+
+
+class ThrottlingHandler(FakeHandler):
+    """
+    Answers the first requests with the throttling status code configured on the backend.
+    """
+
+    def handle_request(self):
+        self.read_body()
+        with self.server.lock:
+            self.server.calls += 1
+            throttled = self.server.calls <= self.server.failures
+
+        if throttled:
+            self.respond(self.server.error, self.server.status, {"Retry-After": "0"})
+        else:
+            self.respond([{"group": "leftshiftone"}])
+
+    do_PUT = handle_request
+    do_POST = handle_request
+
+
+class TransportTest(unittest.TestCase):
+
+    def serve(self, status: int, failures: int, policy: TransportPolicy, error: any = b"throttled"):
+        server = FakeBackend(ThrottlingHandler).start(self)
+        server.status, server.failures, server.calls, server.error = status, failures, 0, error
+
+        config = GlassBoxConfig(server.url, HMACCredentials("key", "secret"), policy)
+        return server, GlassBox(config)
+
+    def test_retry_throttled(self):
+        server, glassbox = self.serve(429, 2, TransportPolicy(rate=1000, backoff_base=0.01))
+
+        self.assertEqual(glassbox.search_model(), [{"group": "leftshiftone"}])
+        self.assertEqual(server.calls, 3)
+        self.assertLess(glassbox._transport.limiter.limit, glassbox.config.policy.max_concurrency)
+
+    def test_retry_exhausted(self):
+        server, glassbox = self.serve(503, 10, TransportPolicy(rate=1000, max_retries=2, backoff_base=0.01))
+
+        with self.assertRaises(requests.HTTPError):
+            glassbox.search_model()
+        self.assertEqual(server.calls, 3)
+
+    def test_no_retry_non_idempotent(self):
+        server, glassbox = self.serve(500, 1, TransportPolicy(rate=1000, backoff_base=0.01))
+
+        with self.assertRaises(requests.HTTPError):
+            glassbox.http_post("model", {})
+        self.assertEqual(server.calls, 1)
+
+    def test_client_error(self):
+        # api gateway answers rejected requests without an errorMessage
+        server, glassbox = self.serve(403, 10, TransportPolicy(rate=1000), {"message": "Forbidden"})
+
+        with self.assertRaises(requests.HTTPError):
+            glassbox.search_model()
+        with self.assertRaises(requests.HTTPError):
+            glassbox.http_put("model", {})
+        with self.assertRaises(requests.HTTPError):
+            list(glassbox.iter_models())
+        self.assertEqual(server.calls, 3)
+
+    def test_error_message(self):
+        server, glassbox = self.serve(400, 10, TransportPolicy(rate=1000), {"errorMessage": "invalid model"})
+
+        with self.assertRaisesRegex(ValueError, "invalid model"):
+            glassbox.http_put("model", {})
+
+    def test_shared_transport(self):
+        server, glassbox = self.serve(200, 0, TransportPolicy(rate=1000))
+        barrier = threading.Barrier(8)
+
+        def put():
+            barrier.wait()
+            glassbox.http_put("model", {})
+
+        def create_transport(policy: TransportPolicy) -> Transport:
+            # widens the window in which concurrent first requests could create their own transport
+            time.sleep(0.05)
+            return Transport(policy)
+
+        with mock.patch("sdk.mixin.http_mixin.Transport", side_effect=create_transport) as transport:
+            threads = [threading.Thread(target=put) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(transport.call_count, 1)
+        self.assertEqual(server.calls, 8)
+
+    def test_circuit_breaker(self):
+        policy = TransportPolicy(rate=1000, max_retries=0, breaker_threshold=2, breaker_reset=60)
+        server, glassbox = self.serve(500, 10, policy)
+
+        for _ in range(2):
+            with self.assertRaises(requests.HTTPError):
+                glassbox.search_model()
+        self.assertEqual(glassbox._transport.breaker.state, CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            glassbox.search_model()
+        self.assertEqual(server.calls, 2)
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after("3"), 3.0)
+        self.assertEqual(retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(retry_after("invalid"))
+        self.assertIsNone(retry_after(None))